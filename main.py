@@ -1,9 +1,8 @@
 import sys
-import random
-from collections import deque
 import json
 import os
 
+import numpy as np
 import pygame
 
 # ----------------------------
@@ -23,10 +22,10 @@ DIFFICULTY_ORDER = ["Easy", "Medium", "Hard", "Custom"]
 BASE_CELL = 40
 BASE_TOPBAR = 48
 
-current_difficulty = "Medium"
+DEFAULT_DIFFICULTY = "Medium"
 
-def get_grid_settings():
-    d = DIFFICULTIES[current_difficulty]
+def get_grid_settings(difficulty):
+    d = DIFFICULTIES[difficulty]
     gw = d["grid_w"]
     gh = d["grid_h"]
     if "mines" in d:
@@ -35,10 +34,10 @@ def get_grid_settings():
         mines = max(1, int(gw * gh * d.get("density", 0.15)))
     return gw, gh, mines
 
-GRID_W, GRID_H, MINES = get_grid_settings()
+_init_w, _init_h, _ = get_grid_settings(DEFAULT_DIFFICULTY)
 
-WINDOW_W = GRID_W * BASE_CELL
-WINDOW_H = BASE_TOPBAR + GRID_H * BASE_CELL
+WINDOW_W = _init_w * BASE_CELL
+WINDOW_H = BASE_TOPBAR + _init_h * BASE_CELL
 
 FPS = 60
 
@@ -77,18 +76,18 @@ NUM_COLORS = {
 }
 
 
-def in_bounds(x, y):
-    return 0 <= x < GRID_W and 0 <= y < GRID_H
+NEIGHBOR_OFFSETS = tuple((dx, dy) for dx in (-1, 0, 1) for dy in (-1, 0, 1) if (dx, dy) != (0, 0))
 
 
-def neighbors(x, y):
-    for dy in (-1, 0, 1):
-        for dx in (-1, 0, 1):
-            if dx == 0 and dy == 0:
-                continue
-            nx, ny = x + dx, y + dy
-            if in_bounds(nx, ny):
-                yield nx, ny
+def _dilate8(mask):
+    """One step of 8-connected binary dilation via shifted slices."""
+    d = mask.copy()
+    d[:-1, :] |= mask[1:, :]
+    d[1:, :] |= mask[:-1, :]
+    out = d.copy()
+    out[:, :-1] |= d[:, 1:]
+    out[:, 1:] |= d[:, :-1]
+    return out
 
 
 def load_best_times():
@@ -117,31 +116,48 @@ class Minesweeper:
     def __init__(self):
         self.first_click_zero_spread = True
         self.best_times = load_best_times()
+        self.difficulty = DEFAULT_DIFFICULTY
         self.reset()
 
     def reset(self):
-        global GRID_W, GRID_H, MINES
-        GRID_W, GRID_H, MINES = get_grid_settings()
-
-        self.mines = [[False] * GRID_H for _ in range(GRID_W)]
-        self.numbers = [[0] * GRID_H for _ in range(GRID_W)]
-        self.revealed = [[False] * GRID_H for _ in range(GRID_W)]
-        self.flagged = [[False] * GRID_H for _ in range(GRID_W)]
+        # Instance attributes instead of module globals: attribute loads
+        # are cheaper than global dict lookups in the per-cell paths, and
+        # the board no longer leaks sizing state across instances.
+        self.w, self.h, self.n_mines = get_grid_settings(self.difficulty)
+
+        # Struct-of-arrays board state: contiguous NumPy planes instead of
+        # nested Python lists, so per-cell loops are single strided loads.
+        self.mines = np.zeros((self.w, self.h), dtype=np.uint8)
+        self.numbers = np.zeros((self.w, self.h), dtype=np.int8)
+        self.revealed = np.zeros((self.w, self.h), dtype=np.uint8)
+        self.flagged = np.zeros((self.w, self.h), dtype=np.uint8)
 
         self.generated = False
         self.game_over = False
         self.win = False
         self.exploded = None
 
-        self.flags_left = MINES
+        self.flags_left = self.n_mines
         self.reveal_count = 0
 
         self.started = False
         self.start_ticks = 0
         self.end_ticks = None
 
+        # Cells whose appearance changed since the last draw; dirty_all
+        # forces a full repaint of the cached grid surface.
+        self.dirty = set()
+        self.dirty_all = True
+
+    def set_difficulty(self, name):
+        self.difficulty = name
+        self.reset()
+
     def get_best_time(self):
-        return self.best_times.get(current_difficulty, None)
+        return self.best_times.get(self.difficulty, None)
+
+    def in_bounds(self, x, y):
+        return 0 <= x < self.w and 0 <= y < self.h
 
     def elapsed_s(self):
         if not self.started:
@@ -163,66 +179,72 @@ class Minesweeper:
         self.first_click_zero_spread = not self.first_click_zero_spread
 
     def _place_mines(self, safe_x, safe_y):
-        forbidden = {(safe_x, safe_y)}
+        forbidden = np.zeros(self.w * self.h, dtype=bool)
+        forbidden[safe_x * self.h + safe_y] = True
         if self.first_click_zero_spread:
-            for nx, ny in neighbors(safe_x, safe_y):
-                forbidden.add((nx, ny))
+            for dx, dy in NEIGHBOR_OFFSETS:
+                nx, ny = safe_x + dx, safe_y + dy
+                if self.in_bounds(nx, ny):
+                    forbidden[nx * self.h + ny] = True
 
-        candidates = [(x, y) for x in range(GRID_W) for y in range(GRID_H) if (x, y) not in forbidden]
-        if len(candidates) < MINES:
-            candidates = [(x, y) for x in range(GRID_W) for y in range(GRID_H) if (x, y) != (safe_x, safe_y)]
+        valid = np.flatnonzero(~forbidden)
+        if len(valid) < self.n_mines:
+            forbidden[:] = False
+            forbidden[safe_x * self.h + safe_y] = True
+            valid = np.flatnonzero(~forbidden)
 
-        for x, y in random.sample(candidates, MINES):
-            self.mines[x][y] = True
+        picks = np.random.choice(valid, self.n_mines, replace=False)
+        self.mines.reshape(-1)[picks] = 1
 
-        for x in range(GRID_W):
-            for y in range(GRID_H):
-                if self.mines[x][y]:
-                    self.numbers[x][y] = -1
-                else:
-                    self.numbers[x][y] = sum(1 for nx, ny in neighbors(x, y) if self.mines[nx][ny])
+        self._compute_numbers()
 
         self.generated = True
 
-        if self.first_click_zero_spread and self.numbers[safe_x][safe_y] != 0:
-            self.mines = [[False] * GRID_H for _ in range(GRID_W)]
-            self.numbers = [[0] * GRID_H for _ in range(GRID_W)]
-            self._place_mines(safe_x, safe_y)
+    def _compute_numbers(self):
+        # Neighbor counts as a 3x3 stencil: sum the 8 shifted views of a
+        # zero-padded mine grid instead of looping over every cell.
+        padded = np.pad(self.mines, 1)
+        counts = np.zeros((self.w, self.h), dtype=np.int8)
+        for dx in (0, 1, 2):
+            for dy in (0, 1, 2):
+                if dx == 1 and dy == 1:
+                    continue
+                counts += padded[dx:dx + self.w, dy:dy + self.h]
+        counts[self.mines.astype(bool)] = -1
+        self.numbers = counts
 
     def _flood_reveal_zeros(self, start_x, start_y):
-        q = deque()
-        q.append((start_x, start_y))
-        visited = set()
-
-        while q:
-            x, y = q.popleft()
-            if (x, y) in visited:
-                continue
-            visited.add((x, y))
-
-            if self.flagged[x][y] or self.revealed[x][y]:
-                continue
-
-            self.revealed[x][y] = True
-            self.reveal_count += 1
-
-            if self.numbers[x][y] == 0:
-                for nx, ny in neighbors(x, y):
-                    if not self.revealed[nx][ny] and not self.flagged[nx][ny]:
-                        q.append((nx, ny))
+        # Grow the connected zero region around the click as whole-array
+        # ops: dilate the seed within the zero mask until it stops
+        # changing, then reveal the region plus its numbered border.
+        # Already-revealed zeros are excluded so the growth stops at them,
+        # matching the old BFS.
+        zeros = (self.numbers == 0) & ~self.flagged.astype(bool) & ~self.revealed.astype(bool)
+        region = np.zeros_like(zeros)
+        region[start_x, start_y] = True
+        while True:
+            grown = _dilate8(region) & zeros
+            if (grown == region).all():
+                break
+            region = grown
+
+        border = _dilate8(region) & ~self.flagged.astype(bool)
+        new = border & ~self.revealed.astype(bool)
+        self.revealed[new] = 1
+        self.dirty.update((int(x), int(y)) for x, y in np.argwhere(new))
 
     def _reveal_single(self, x, y):
-        if self.flagged[x][y] or self.revealed[x][y]:
+        if self.flagged[x, y] or self.revealed[x, y]:
             return
-        self.revealed[x][y] = True
-        self.reveal_count += 1
+        self.revealed[x, y] = 1
+        self.dirty.add((x, y))
 
     def reveal(self, x, y):
         if self.game_over or self.win:
             return
-        if not in_bounds(x, y):
+        if not self.in_bounds(x, y):
             return
-        if self.flagged[x][y] or self.revealed[x][y]:
+        if self.flagged[x, y] or self.revealed[x, y]:
             return
 
         self._start_timer_if_needed()
@@ -230,17 +252,16 @@ class Minesweeper:
         if not self.generated:
             self._place_mines(x, y)
 
-        if self.mines[x][y]:
+        if self.mines[x, y]:
             self.game_over = True
             self.exploded = (x, y)
             self._finalize_timer()
-            for ix in range(GRID_W):
-                for iy in range(GRID_H):
-                    if self.mines[ix][iy]:
-                        self.revealed[ix][iy] = True
+            to_show = self.mines.astype(bool) & ~self.revealed.astype(bool)
+            self.revealed[to_show] = 1
+            self.dirty.update((int(ix), int(iy)) for ix, iy in np.argwhere(to_show))
             return
 
-        if self.numbers[x][y] == 0:
+        if self.numbers[x, y] == 0:
             self._flood_reveal_zeros(x, y)
         else:
             self._reveal_single(x, y)
@@ -250,70 +271,75 @@ class Minesweeper:
     def toggle_flag(self, x, y):
         if self.game_over or self.win:
             return
-        if not in_bounds(x, y):
+        if not self.in_bounds(x, y):
             return
-        if self.revealed[x][y]:
+        if self.revealed[x, y]:
             return
 
-        if self.flagged[x][y]:
-            self.flagged[x][y] = False
+        if self.flagged[x, y]:
+            self.flagged[x, y] = 0
             self.flags_left += 1
         else:
             if self.flags_left <= 0:
                 return
-            self.flagged[x][y] = True
+            self.flagged[x, y] = 1
             self.flags_left -= 1
+        self.dirty.add((x, y))
 
     def chord(self, x, y):
         if self.game_over or self.win:
             return
-        if not in_bounds(x, y):
+        if not self.in_bounds(x, y):
             return
-        if not self.revealed[x][y]:
+        if not self.revealed[x, y]:
             return
-        n = self.numbers[x][y]
+        n = self.numbers[x, y]
         if n <= 0:
             return
 
-        adj_flags = sum(1 for nx, ny in neighbors(x, y) if self.flagged[nx][ny])
+        x0, x1 = max(0, x - 1), min(self.w, x + 2)
+        y0, y1 = max(0, y - 1), min(self.h, y + 2)
+        adj_flags = int(self.flagged[x0:x1, y0:y1].sum()) - int(self.flagged[x, y])
         if adj_flags != n:
             return
 
-        for nx, ny in neighbors(x, y):
-            if not self.flagged[nx][ny] and not self.revealed[nx][ny]:
-                self.reveal(nx, ny)
+        for dx, dy in NEIGHBOR_OFFSETS:
+            nx, ny = x + dx, y + dy
+            if 0 <= nx < self.w and 0 <= ny < self.h:
+                if not self.flagged[nx, ny] and not self.revealed[nx, ny]:
+                    self.reveal(nx, ny)
 
     def _check_win(self):
-        total_safe = GRID_W * GRID_H - MINES
+        total_safe = self.w * self.h - self.n_mines
+        self.reveal_count = int(self.revealed.sum())
         if self.reveal_count >= total_safe and not self.game_over:
             self.win = True
             self._finalize_timer()
 
             t = self.elapsed_s()
-            best = self.best_times.get(current_difficulty, None)
+            best = self.best_times.get(self.difficulty, None)
             if t > 0 and (best is None or t < best):
-                self.best_times[current_difficulty] = t
+                self.best_times[self.difficulty] = t
                 save_best_times(self.best_times)
 
-            for x in range(GRID_W):
-                for y in range(GRID_H):
-                    if self.mines[x][y] and not self.flagged[x][y]:
-                        self.flagged[x][y] = True
+            to_flag = self.mines.astype(bool) & ~self.flagged.astype(bool)
+            self.flagged[to_flag] = 1
+            self.dirty.update((int(x), int(y)) for x, y in np.argwhere(to_flag))
             self.flags_left = 0
 
 
-def compute_layout(screen_w, screen_h):
+def compute_layout(screen_w, screen_h, board_w, board_h):
     scale = min(
-        screen_w / (GRID_W * BASE_CELL),
-        screen_h / (BASE_TOPBAR + GRID_H * BASE_CELL),
+        screen_w / (board_w * BASE_CELL),
+        screen_h / (BASE_TOPBAR + board_h * BASE_CELL),
     )
     scale = max(0.5, min(scale, 2.5))
 
     cell = max(12, int(BASE_CELL * scale))
     topbar = max(28, int(BASE_TOPBAR * scale))
 
-    grid_w = GRID_W * cell
-    grid_h = GRID_H * cell
+    grid_w = board_w * cell
+    grid_h = board_h * cell
 
     origin_x = (screen_w - grid_w) // 2
     origin_y = topbar + (screen_h - topbar - grid_h) // 2
@@ -331,23 +357,37 @@ def compute_layout(screen_w, screen_h):
     }
 
 
+# SysFont does a font lookup and TTF parse per call, so cache fonts by
+# (name, size, bold) instead of constructing them every frame.
+_font_cache = {}
+
+
+def _sysfont(name, size, bold=False):
+    key = (name, size, bold)
+    f = _font_cache.get(key)
+    if f is None:
+        f = pygame.font.SysFont(name, size, bold=bold)
+        _font_cache[key] = f
+    return f
+
+
 def build_fonts(scale):
     title_size = max(16, int(22 * scale))
     small_size = max(10, int(16 * scale))
     btn_size = max(10, int(14 * scale))
     return (
-        pygame.font.SysFont("segoe ui", title_size, bold=True),
-        pygame.font.SysFont("segoe ui", small_size, bold=False),
-        pygame.font.SysFont("segoe ui", btn_size, bold=False),
+        _sysfont("segoe ui", title_size, bold=True),
+        _sysfont("segoe ui", small_size),
+        _sysfont("segoe ui", btn_size),
     )
 
 
-def cell_from_mouse(mx, my, layout):
+def cell_from_mouse(mx, my, layout, game):
     cell = layout["cell"]
     ox, oy = layout["origin_x"], layout["origin_y"]
     gx = (mx - ox) // cell
     gy = (my - oy) // cell
-    if in_bounds(gx, gy) and (mx >= ox) and (my >= oy):
+    if game.in_bounds(gx, gy) and (mx >= ox) and (my >= oy):
         return gx, gy
     return None
 
@@ -385,15 +425,30 @@ def draw_flag_icon(screen, rect):
     )
 
 
+# The top-bar info string only changes when the timer/best time/flag
+# state does, so remember the last shrink-to-fit result.
+_fit_cache = {"key": None, "result": None}
+
+
 def fit_text_render(font_name, initial_size, min_size, text, color, max_width, bold=False):
+    key = (font_name, initial_size, min_size, text, color, max_width, bold)
+    if _fit_cache["key"] == key:
+        return _fit_cache["result"]
+    result = _fit_text_render(font_name, initial_size, min_size, text, color, max_width, bold)
+    _fit_cache["key"] = key
+    _fit_cache["result"] = result
+    return result
+
+
+def _fit_text_render(font_name, initial_size, min_size, text, color, max_width, bold):
     size = initial_size
     while size >= min_size:
-        f = pygame.font.SysFont(font_name, size, bold=bold)
+        f = _sysfont(font_name, size, bold=bold)
         s = f.render(text, True, color)
         if s.get_width() <= max_width:
             return s, f
         size -= 1
-    f = pygame.font.SysFont(font_name, min_size, bold=bold)
+    f = _sysfont(font_name, min_size, bold=bold)
     ell = "…"
     t = text
     while t and f.render(t + ell, True, color).get_width() > max_width:
@@ -411,10 +466,10 @@ def draw_button(screen, font, rect, label, emphasized=False):
     screen.blit(t, t.get_rect(center=rect.center))
 
 
-def draw_difficulty_buttons(screen, btn_font, layout, hover_pos):
+def draw_difficulty_buttons(screen, btn_font, layout, hover_pos, current):
     rects = difficulty_button_rects(layout, btn_font)
     for name, rect in rects:
-        is_current = (name == current_difficulty)
+        is_current = (name == current)
         is_hover = rect.collidepoint(hover_pos) if hover_pos else False
         if is_current:
             bg = (100, 130, 180)
@@ -453,6 +508,128 @@ def draw_endgame_overlay(screen, font, small_font, game, layout):
     screen.blit(hint, hint_pos)
 
 
+# Cached per-cell rendering of the grid; repainted in full only on layout
+# change or reset, otherwise only cells in game.dirty are redrawn.
+_grid_cache = {"key": None, "surface": None}
+
+# Digit/mine/flag sprites pre-rendered once per cell size, so the per-cell
+# path is a single blit instead of text shaping or polygon rasterization.
+_glyph_cache = {"key": None, "glyphs": None}
+
+
+def _build_glyphs(cell, font):
+    glyphs = {}
+    for n in range(1, 9):
+        s = pygame.Surface((cell, cell), pygame.SRCALPHA)
+        t = font.render(str(n), True, NUM_COLORS.get(n, (0, 0, 0)))
+        s.blit(t, t.get_rect(center=(cell // 2, cell // 2)))
+        glyphs[n] = s
+
+    for name, color in (("mine", (120, 120, 120)), ("mine_hit", (255, 90, 90))):
+        s = pygame.Surface((cell, cell), pygame.SRCALPHA)
+        pygame.draw.circle(s, color, (cell // 2, cell // 2), cell // 4)
+        pygame.draw.circle(s, MINE, (cell // 2, cell // 2), cell // 7)
+        glyphs[name] = s
+
+    s = pygame.Surface((cell, cell), pygame.SRCALPHA)
+    pole_x = cell // 2 - 3
+    pygame.draw.rect(s, (90, 90, 90), (pole_x, 6, 3, cell - 12))
+    pygame.draw.polygon(s, FLAG, [(pole_x + 3, 8), (cell - 6, 14), (pole_x + 3, 20)])
+    glyphs["flag"] = s
+    return glyphs
+
+
+def _get_glyphs(cell, font):
+    key = (cell, font.get_height())
+    if _glyph_cache["key"] != key:
+        _glyph_cache["key"] = key
+        _glyph_cache["glyphs"] = _build_glyphs(cell, font)
+    return _glyph_cache["glyphs"]
+
+
+# Revealed-cell checkerboard background, composited once per layout so
+# cell rendering copies from it instead of re-filling per-cell rects.
+_checker_cache = {"key": None, "surface": None}
+
+
+def _get_checker(cell, board_w, board_h):
+    key = (cell, board_w, board_h)
+    if _checker_cache["key"] != key:
+        _checker_cache["key"] = key
+        s = pygame.Surface((board_w * cell, board_h * cell))
+        s.fill(REVEALED)
+        for x in range(board_w):
+            for y in range(board_h):
+                if (x + y) % 2:
+                    s.fill(REVEALED_2, (x * cell, y * cell, cell, cell))
+        _checker_cache["surface"] = s
+    return _checker_cache["surface"]
+
+
+# Grid-relative cell rects, rebuilt only when the cell size or grid
+# dimensions change rather than W*H Rect allocations per frame.
+_rect_cache = {"key": None, "rects": None}
+
+
+def _get_cell_rects(cell, board_w, board_h):
+    key = (cell, board_w, board_h)
+    if _rect_cache["key"] != key:
+        _rect_cache["key"] = key
+        _rect_cache["rects"] = [
+            [pygame.Rect(x * cell, y * cell, cell, cell) for y in range(board_h)]
+            for x in range(board_w)
+        ]
+    return _rect_cache["rects"]
+
+
+# Grid-line overlay baked once per layout; full repaints blit it instead
+# of re-stroking every cell boundary.
+_lines_cache = {"key": None, "surface": None}
+
+
+def _get_grid_lines(cell, board_w, board_h):
+    key = (cell, board_w, board_h)
+    if _lines_cache["key"] != key:
+        _lines_cache["key"] = key
+        s = pygame.Surface((board_w * cell, board_h * cell), pygame.SRCALPHA)
+        _draw_grid_lines(s, cell, board_w, board_h)
+        _lines_cache["surface"] = s
+    return _lines_cache["surface"]
+
+
+def _draw_grid_lines(target, cell, board_w, board_h):
+    # Matches the per-cell 1px rect outlines: a line on each side of
+    # every cell boundary, in W+H passes instead of W*H rect calls.
+    grid_w, grid_h = board_w * cell, board_h * cell
+    for x in range(board_w):
+        px = x * cell
+        pygame.draw.line(target, LINE, (px, 0), (px, grid_h - 1))
+        pygame.draw.line(target, LINE, (px + cell - 1, 0), (px + cell - 1, grid_h - 1))
+    for y in range(board_h):
+        py = y * cell
+        pygame.draw.line(target, LINE, (0, py), (grid_w - 1, py))
+        pygame.draw.line(target, LINE, (0, py + cell - 1), (grid_w - 1, py + cell - 1))
+
+
+def _render_cell(target, game, x, y, glyphs, checker, r, hover=False):
+    if game.revealed[x, y]:
+        target.blit(checker, r, r)
+        if game.mines[x, y]:
+            target.blit(glyphs["mine_hit" if game.exploded == (x, y) else "mine"], r)
+        else:
+            n = game.numbers[x, y]
+            if n > 0:
+                target.blit(glyphs[int(n)], r)
+    else:
+        base = COVER_HI if hover else COVER
+        pygame.draw.rect(target, base, r)
+
+        if game.flagged[x, y]:
+            target.blit(glyphs["flag"], r)
+
+    pygame.draw.rect(target, LINE, r, 1)
+
+
 def draw(screen, font, small_font, btn_font, game: Minesweeper, hover_cell, mouse_buttons, layout, mouse_pos):
     screen.fill(BG)
 
@@ -460,7 +637,7 @@ def draw(screen, font, small_font, btn_font, game: Minesweeper, hover_cell, mous
     pygame.draw.rect(screen, PANEL, pygame.Rect(0, 0, layout["screen_w"], layout["topbar"]))
 
     # Difficulty buttons (left side)
-    diff_rects = draw_difficulty_buttons(screen, btn_font, layout, mouse_pos)
+    diff_rects = draw_difficulty_buttons(screen, btn_font, layout, mouse_pos, game.difficulty)
 
     # Calculate right side info area start
     if diff_rects:
@@ -497,43 +674,42 @@ def draw(screen, font, small_font, btn_font, game: Minesweeper, hover_cell, mous
     cell = layout["cell"]
     ox, oy = layout["origin_x"], layout["origin_y"]
 
-    # Cells
-    for x in range(GRID_W):
-        for y in range(GRID_H):
-            r = pygame.Rect(ox + x * cell, oy + y * cell, cell, cell)
+    # Cells: repaint the cached grid surface (fully on layout change or
+    # reset, otherwise only dirty cells), then blit it once.
+    key = (cell, game.w, game.h)
+    if _grid_cache["key"] != key:
+        _grid_cache["key"] = key
+        _grid_cache["surface"] = pygame.Surface((layout["grid_w"], layout["grid_h"]))
+        game.dirty_all = True
+    grid_surface = _grid_cache["surface"]
+    glyphs = _get_glyphs(cell, font)
+    checker = _get_checker(cell, game.w, game.h)
+    rects = _get_cell_rects(cell, game.w, game.h)
+
+    if game.dirty_all:
+        # Full repaint: one COVER fill plus grid lines covers the common
+        # case; only revealed or flagged cells need individual rendering.
+        grid_surface.fill(COVER)
+        grid_surface.blit(_get_grid_lines(cell, game.w, game.h), (0, 0))
+        for x, y in np.argwhere((game.revealed | game.flagged).astype(bool)):
+            _render_cell(grid_surface, game, int(x), int(y), glyphs, checker, rects[x][y])
+        game.dirty_all = False
+    else:
+        for x, y in game.dirty:
+            _render_cell(grid_surface, game, x, y, glyphs, checker, rects[x][y])
+    game.dirty.clear()
 
-            if game.revealed[x][y]:
-                base = REVEALED if (x + y) % 2 == 0 else REVEALED_2
-                pygame.draw.rect(screen, base, r)
-                if game.mines[x][y]:
-                    color = (255, 90, 90) if game.exploded == (x, y) else (120, 120, 120)
-                    pygame.draw.circle(screen, color, r.center, cell // 4)
-                    pygame.draw.circle(screen, MINE, r.center, cell // 7)
-                else:
-                    n = game.numbers[x][y]
-                    if n > 0:
-                        t = font.render(str(n), True, NUM_COLORS.get(n, (0, 0, 0)))
-                        screen.blit(t, t.get_rect(center=r.center))
-            else:
-                is_hover = (hover_cell == (x, y))
-                base = COVER_HI if is_hover else COVER
-                pygame.draw.rect(screen, base, r)
-
-                if game.flagged[x][y]:
-                    pole_x = r.left + cell // 2 - 3
-                    pygame.draw.rect(screen, (90, 90, 90), (pole_x, r.top + 6, 3, cell - 12))
-                    pygame.draw.polygon(
-                        screen,
-                        FLAG,
-                        [(pole_x + 3, r.top + 8), (r.left + cell - 6, r.top + 14), (pole_x + 3, r.top + 20)],
-                    )
-
-            pygame.draw.rect(screen, LINE, r, 1)
+    screen.blit(grid_surface, (ox, oy))
+
+    # Hover highlight as a transient overlay so it never dirties the cache
+    if hover_cell and not game.revealed[hover_cell]:
+        hx, hy = hover_cell
+        _render_cell(screen, game, hx, hy, glyphs, checker, rects[hx][hy].move(ox, oy), hover=True)
 
     # Chord hint highlight
     if hover_cell and mouse_buttons[0] and mouse_buttons[2]:
         x, y = hover_cell
-        if game.revealed[x][y] and game.numbers[x][y] > 0:
+        if game.revealed[x, y] and game.numbers[x, y] > 0:
             r = pygame.Rect(ox + x * cell, oy + y * cell, cell, cell)
             pygame.draw.rect(screen, (255, 255, 255), r, 2)
 
@@ -545,8 +721,6 @@ def draw(screen, font, small_font, btn_font, game: Minesweeper, hover_cell, mous
 
 
 def main():
-    global current_difficulty
-
     pygame.init()
     pygame.display.set_caption("Pysweeper")
     screen = pygame.display.set_mode((WINDOW_W, WINDOW_H), pygame.RESIZABLE)
@@ -558,14 +732,30 @@ def main():
     end_state_ticks = None
     diff_rects = []
 
+    # Layout and fonts depend only on the window size and grid shape;
+    # rebuild them when either changes instead of every frame.
+    layout_key = None
+    layout = None
+    font = small_font = btn_font = None
+
+    # Redraw only when something visible changed; idle frames just wait
+    # on events instead of re-rendering and flipping at 60 FPS.
+    needs_redraw = True
+    last_mouse = None
+    last_pressed = None
+
     while True:
-        clock.tick(FPS)
         screen_w, screen_h = screen.get_size()
-        layout = compute_layout(screen_w, screen_h)
-        font, small_font, btn_font = build_fonts(layout["scale"])
+        key = (screen_w, screen_h, game.w, game.h)
+        if key != layout_key:
+            layout_key = key
+            layout = compute_layout(screen_w, screen_h, game.w, game.h)
+            font, small_font, btn_font = build_fonts(layout["scale"])
+            needs_redraw = True
 
         mx, my = pygame.mouse.get_pos()
-        hover_cell = cell_from_mouse(mx, my, layout)
+        hover_cell = cell_from_mouse(mx, my, layout, game)
+        pressed = pygame.mouse.get_pressed()
 
         if AUTO_RESTART and (game.win or game.game_over):
             if end_state_ticks is None:
@@ -576,15 +766,35 @@ def main():
         else:
             end_state_ticks = None
 
-        # Draw call moved here to ensure diff_rects is populated before event loop for the frame
-        diff_rects = draw(screen, font, small_font, btn_font, game, hover_cell, pygame.mouse.get_pressed(), layout, (mx, my))
-        pygame.display.flip()
+        timer_running = game.started and game.end_ticks is None
+        if (
+            game.dirty_all
+            or game.dirty
+            or timer_running
+            or (mx, my) != last_mouse
+            or pressed != last_pressed
+        ):
+            needs_redraw = True
+        last_mouse = (mx, my)
+        last_pressed = pressed
+
+        # Draw call kept before the event loop so diff_rects is populated for hit-testing
+        if needs_redraw:
+            clock.tick(FPS)
+            diff_rects = draw(screen, font, small_font, btn_font, game, hover_cell, pressed, layout, (mx, my))
+            pygame.display.flip()
+            needs_redraw = False
+        else:
+            pygame.time.wait(16)
 
         for event in pygame.event.get():
             if event.type == pygame.QUIT:
                 pygame.quit()
                 sys.exit(0)
 
+            if event.type in (pygame.KEYDOWN, pygame.MOUSEBUTTONDOWN):
+                needs_redraw = True
+
             if event.type == pygame.KEYDOWN:
                 if event.key == pygame.K_r:
                     game.reset()
@@ -598,9 +808,8 @@ def main():
                     clicked_diff = False
                     for name, rect in diff_rects:
                         if rect.collidepoint(event.pos):
-                            if name != current_difficulty:
-                                current_difficulty = name
-                                game.reset()
+                            if name != game.difficulty:
+                                game.set_difficulty(name)
                                 # Window resize removed; grid will refit current window next frame
                             clicked_diff = True
                             break
@@ -616,14 +825,12 @@ def main():
                 if hover_cell:
                     x, y = hover_cell
                     if event.button == 1:
-                        buttons = pygame.mouse.get_pressed(3)
-                        if buttons[2]: # Right + Left chord
+                        if pressed[2]: # Right + Left chord
                             game.chord(x, y)
                         else:
                             game.reveal(x, y)
                     elif event.button == 3:
-                        buttons = pygame.mouse.get_pressed(3)
-                        if buttons[0]: # Left + Right chord
+                        if pressed[0]: # Left + Right chord
                             game.chord(x, y)
                         else:
                             game.toggle_flag(x, y)